@@ -12,17 +12,21 @@ Build for Android with Buildozer (from this directory):
 """
 from __future__ import annotations
 
+import functools
+import math
 from fractions import Fraction
 
 from kivy.app import App
+from kivy.factory import Factory
 from kivy.graphics import Color, Rectangle
-from kivy.lang import Builder
+from kivy.graphics.texture import Texture
 from kivy.metrics import dp
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.label import Label
-from kivy.uix.scrollview import ScrollView
+from kivy.uix.recyclegridlayout import RecycleGridLayout
+from kivy.uix.recycleview import RecycleView
 from kivy.uix.tabbedpanel import TabbedPanel, TabbedPanelItem
 from kivy.uix.textinput import TextInput
 
@@ -31,220 +35,248 @@ from kivy.uix.textinput import TextInput
 MM_PER_INCH: float = 25.4
 APP_VERSION = "1.0.0"
 
-# All unique reduced fractions with denominators 2, 4, 8, 16, 32, 64 — sorted
-COMMON_FRACTIONS: list[Fraction] = sorted(set(
-    Fraction(n, d)
-    for d in [2, 4, 8, 16, 32, 64]
-    for n in range(1, d)
-    if Fraction(n, d).denominator == d
-))
+# All unique reduced fractions with denominators 2, 4, 8, 16, 32, 64 — sorted.
+# Every one of them is some n/64, so enumerating the 64ths in order (each
+# Fraction auto-reduces) yields the set already sorted.
+COMMON_FRACTIONS: list[Fraction] = [Fraction(n, 64) for n in range(1, 64)]
+
+# Pre-computed reference table rows (avoids repeated computation at runtime).
+# Each fraction is converted and formatted once, then shared by all three tables.
+# Every cell is a (display_str, value) pair, so a tapped row hands its number
+# straight to the calculator without re-parsing the text. mm cells carry the
+# value of their rounded display string, matching what typing it would give.
+_floats = [float(f) for f in COMMON_FRACTIONS]
+_fcells = [(str(f), v) for f, v in zip(COMMON_FRACTIONS, _floats)]
+_dcells = [(f"{v:.6f}", v) for v in _floats]
+_mcells = [(m, float(m)) for m in (f"{v * MM_PER_INCH:.4f}" for v in _floats)]
+
+_FRAC_ROWS   = list(zip(_fcells, _dcells))
+_INCHES_ROWS = list(zip(_fcells, _dcells, _mcells))
+_MM_ROWS     = list(zip(_mcells, _dcells, _fcells))
+
+# Reduced fraction text for each remainder in 64ths, indexed by numerator
+# (index 0 is unused: a whole number has no fractional part)
+_SNAP64: tuple[str, ...] = ("",) + tuple(
+    f"{n // math.gcd(n, 64)}/{64 // math.gcd(n, 64)}" for n in range(1, 64)
+)
+
+# Numeric value of every reference-table string, so typing one skips parsing
+_STR_TO_FLOAT: dict[str, float] = dict(_fcells + _dcells + _mcells)
+
+# ── Parsing ───────────────────────────────────────────────────────────────────
+#
+# Pure input parsers shared by the tabs. Each returns (ok, value, error_msg) and
+# is memoized, since reference-row taps re-submit the same handful of strings.
+
+@functools.lru_cache(maxsize=256)
+def _parse_fraction(s: str) -> tuple[bool, float, str]:
+    """Parse a fraction such as ``3/8`` into decimal inches."""
+    raw = s.strip()
+    cached = _STR_TO_FLOAT.get(raw)
+    if cached is not None:
+        return True, cached, ""
+    try:
+        frac = Fraction(raw)
+    except (ValueError, ZeroDivisionError):
+        return False, 0.0, "Enter a fraction like  3/8  or  7/16"
+    if frac < 0:
+        return False, 0.0, "Value must be positive."
+    return True, float(frac), ""
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_inches(s: str) -> tuple[bool, float, str]:
+    """Parse a decimal, fraction, or mixed number (``1 3/8``) into inches."""
+    raw = s.strip()
+    cached = _STR_TO_FLOAT.get(raw)
+    if cached is not None:
+        return True, cached, ""
+    try:
+        try:
+            # Plain decimal e.g. "0.375" — parsed in C, no Fraction needed
+            inches = float(raw)
+            if not math.isfinite(inches):
+                raise ValueError
+        except ValueError:
+            parts = raw.split()
+            if len(parts) == 2:
+                # Mixed number e.g. "1 3/8"
+                inches = float(int(parts[0]) + Fraction(parts[1]))
+            elif len(parts) == 1:
+                # Bare fraction e.g. "3/8"
+                inches = float(Fraction(raw))
+            else:
+                raise ValueError
+    except (ValueError, ZeroDivisionError):
+        return False, 0.0, "Enter a value like  3/8,  1 3/8,  or  0.375"
+    if inches < 0:
+        return False, 0.0, "Value must be positive."
+    return True, inches + 0.0, ""  # float("-0") is -0.0; show it as 0
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_mm(s: str) -> tuple[bool, float, str]:
+    """Parse a millimeter value."""
+    try:
+        mm = float(s.strip())
+    except ValueError:
+        return False, 0.0, "Enter a numeric millimeter value."
+    if mm < 0:
+        return False, 0.0, "Value must be positive."
+    return True, mm, ""
+
+
+# ── Formatting ────────────────────────────────────────────────────────────────
+
+_FMT_CACHE_SIZE = 64
+
+
+def _format_cached(
+    cache: dict[tuple[float, str], str], value: float, spec: str
+) -> str:
+    """Format *value* with *spec*, reusing strings from a small FIFO *cache*."""
+    key = (value, spec)
+    s = cache.get(key)
+    if s is None:
+        s = format(value, spec)
+        if len(cache) >= _FMT_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = s
+    return s
 
-# Pre-computed reference table rows (avoids repeated computation at runtime)
-_FRAC_ROWS   = [(str(f), f"{float(f):.6f}") for f in COMMON_FRACTIONS]
-_INCHES_ROWS = [(str(f), f"{float(f):.6f}", f"{float(f) * MM_PER_INCH:.4f}") for f in COMMON_FRACTIONS]
-_MM_ROWS     = [(f"{float(f) * MM_PER_INCH:.4f}", f"{float(f):.6f}", str(f)) for f in COMMON_FRACTIONS]
 
 # ── Colours (r, g, b, a) ──────────────────────────────────────────────────────
+# Colours of the kv-styled widgets live in decimalconverter.kv; these are the
+# ones still applied from Python.
 
-_C_ACCENT = (0.102, 0.373, 0.706, 1)   # #1a5fb4
-_C_HDR    = (0.15,  0.42,  0.75,  1)   # table column headers
 _C_EVEN   = (0.97,  0.97,  0.97,  1)   # even table rows
 _C_ODD    = (0.90,  0.93,  0.97,  1)   # odd table rows
 _C_WHITE  = (1,     1,     1,     1)
-_C_TEXT   = (0.10,  0.10,  0.10,  1)
-_C_RED    = (0.75,  0.10,  0.10,  1)
 _C_GRAY   = (0.50,  0.50,  0.50,  1)
 
 # ── KV style rules ────────────────────────────────────────────────────────────
-
-Builder.load_string("""
-#:import dp kivy.metrics.dp
-
-<_ConvertButton@Button>:
-    size_hint: 1, None
-    height: dp(52)
-    font_size: dp(17)
-    bold: True
-    background_normal: ''
-    background_color: 0.102, 0.373, 0.706, 1
-    color: 1, 1, 1, 1
-
-<_CalcInput@TextInput>:
-    size_hint: 1, None
-    height: dp(52)
-    font_size: dp(19)
-    multiline: False
-    padding: dp(12), dp(14), dp(12), dp(14)
-
-<_ResultLabel@Label>:
-    size_hint: 1, None
-    height: dp(52)
-    font_size: dp(26)
-    bold: True
-    color: 0.102, 0.373, 0.706, 1
-    halign: 'center'
-    valign: 'middle'
-
-<_SmallLabel@Label>:
-    size_hint: 1, None
-    height: dp(22)
-    font_size: dp(13)
-    halign: 'left'
-    valign: 'middle'
-
-<_ErrorLabel@Label>:
-    size_hint: 1, None
-    height: dp(26)
-    font_size: dp(13)
-    color: 0.75, 0.1, 0.1, 1
-""")
+#
+# The widget style rules live in decimalconverter.kv, which App.load_kv picks up
+# automatically (name derived from DecimalConverterApp) before build() runs.
 
 
 # ── Widget helpers ────────────────────────────────────────────────────────────
 
-def _attach_bg(widget, color: tuple) -> Rectangle:
-    """Draw a solid background rectangle on *widget* and keep it synced."""
-    with widget.canvas.before:
-        Color(*color)
-        rect = Rectangle(size=widget.size, pos=widget.pos)
-    widget.bind(
-        size=lambda _, v: setattr(rect, 'size', v),
-        pos=lambda _, v: setattr(rect, 'pos', v),
-    )
-    return rect
+def _blit_stripes(tex: Texture) -> None:
+    """Fill *tex* with the even/odd row colours."""
+    buf = bytes(round(c * 255) for c in _C_EVEN + _C_ODD)
+    tex.blit_buffer(buf, colorfmt="rgba", bufferfmt="ubyte")
+
+
+@functools.lru_cache(maxsize=1)
+def _stripe_texture() -> Texture:
+    """1 × 2 px even/odd row texture, tiled vertically behind table rows.
+
+    Created lazily because textures need the GL context of a running app.
+    Kivy only reloads file-backed textures after the GL context is lost (e.g.
+    on Android pause/resume), so a reload observer re-blits the pixels.
+    """
+    tex = Texture.create(size=(1, 2), colorfmt="rgba")
+    _blit_stripes(tex)
+    tex.add_reload_observer(_blit_stripes)
+    tex.wrap = "repeat"
+    tex.mag_filter = "nearest"
+    tex.min_filter = "nearest"
+    return tex
 
 
 def _section_header(text: str) -> Label:
     """Accent-coloured section header label."""
-    lbl = Label(
-        text=f"  {text}",
-        size_hint=(1, None),
-        height=dp(34),
-        bold=True,
-        font_size=dp(14),
-        color=_C_WHITE,
-        halign="left",
-        valign="middle",
-    )
-    lbl.bind(size=lbl.setter("text_size"))
-    _attach_bg(lbl, _C_ACCENT)
-    return lbl
+    return Factory._SectionHeader(text=f"  {text}")
 
 
-def _ref_table(col_headers: list[str], rows: list[tuple], on_select) -> ScrollView:
+def _ref_table(col_headers: list[str], rows: list[tuple], on_select) -> BoxLayout:
     """
-    Scrollable reference table.
+    Reference table: a fixed header row above a RecycleView of data rows.
 
-    Each data row is a set of Buttons — clicking any cell in a row calls
-    on_select(row_tuple).
-    """
-    sv = ScrollView(size_hint=(1, 1))
+    Each row is a tuple of (display_str, value) cells.
 
-    grid = GridLayout(cols=len(col_headers), size_hint_y=None, spacing=0, padding=0)
-    grid.bind(minimum_height=grid.setter("height"))
+    Only the cells visible in the viewport exist as widgets; they are recycled
+    as the user scrolls. Tapping any cell in a row calls on_select(row_tuple).
+    """
+    row_h = dp(36)
+    n_cols = len(col_headers)
+    table = BoxLayout(orientation="vertical", size_hint=(1, 1))
 
     # ── Header row ──────────────────────────────────────────────────────────
+    header = GridLayout(cols=n_cols, size_hint_y=None, height=row_h)
     for h in col_headers:
-        lbl = Label(
-            text=h,
-            size_hint_y=None,
-            height=dp(36),
-            bold=True,
-            font_size=dp(12),
-            color=_C_WHITE,
-            halign="center",
-            valign="middle",
-        )
-        lbl.bind(size=lbl.setter("text_size"))
-        _attach_bg(lbl, _C_HDR)
-        grid.add_widget(lbl)
+        header.add_widget(Factory._TableHeader(text=h))
+    table.add_widget(header)
 
     # ── Data rows ────────────────────────────────────────────────────────────
-    for i, row in enumerate(rows):
-        bg = _C_EVEN if i % 2 == 0 else _C_ODD
-        for cell in row:
-            btn = Button(
-                text=cell,
-                size_hint_y=None,
-                height=dp(36),
-                background_normal="",
-                background_color=bg,
-                background_down="",
-                color=_C_TEXT,
-                font_size=dp(13),
-                halign="center",
-                valign="middle",
-            )
-            # Clicking any cell in a row delivers the full row to the callback
-            btn.bind(on_release=lambda b, r=row: on_select(r))
-            grid.add_widget(btn)
-
-    sv.add_widget(grid)
-    return sv
+    rv = RecycleView(viewclass="_RowCell", size_hint=(1, 1))
+    rv.data = [
+        {"text": cell[0], "row_idx": i}
+        for i, row in enumerate(rows)
+        for cell in row
+    ]
+    # Size the layout for every row up front so the first pass is already final
+    n_rows = len(rows)
+    layout = RecycleGridLayout(
+        cols=n_cols,
+        size_hint_y=None,
+        height=row_h * n_rows,
+        default_size=(None, row_h),
+        default_size_hint=(1, None),
+    )
+    layout.bind(minimum_height=layout.setter("height"))
+
+    # All row backgrounds are one Rectangle tiling the striped texture, one
+    # texture period per two rows, running from the top (even) row downwards.
+    with layout.canvas.before:
+        Color(*_C_WHITE)
+        stripes = Rectangle(
+            texture=_stripe_texture(),
+            tex_coords=(0, n_rows / 2, 1, n_rows / 2, 1, 0, 0, 0),
+        )
+
+    def update_stripes(widget, _):
+        stripes.pos = widget.pos
+        stripes.size = widget.size
+
+    layout.bind(pos=update_stripes, size=update_stripes)
+
+    def on_touch_down(widget, touch):
+        if not widget.collide_point(*touch.pos):
+            return False
+        for cell in widget.children:
+            if cell.collide_point(*touch.pos):
+                on_select(rows[cell.row_idx])
+                return True
+        return False
+
+    layout.bind(on_touch_down=on_touch_down)
+
+    rv.add_widget(layout)
+    table.add_widget(rv)
+    return table
 
 
 def _calc_label(text: str, color=_C_GRAY) -> Label:
     """Small field-name label used inside the calculator section."""
-    lbl = Label(
-        text=text,
-        size_hint=(1, None),
-        height=dp(22),
-        font_size=dp(13),
-        color=color,
-        halign="left",
-        valign="middle",
-    )
-    lbl.bind(size=lbl.setter("text_size"))
-    return lbl
+    return Factory._SmallLabel(text=text, color=color)
 
 
 def _result_label() -> Label:
-    lbl = Label(
-        text="—",
-        size_hint=(1, None),
-        height=dp(52),
-        font_size=dp(26),
-        bold=True,
-        color=_C_ACCENT,
-        halign="center",
-        valign="middle",
-    )
-    lbl.bind(size=lbl.setter("text_size"))
-    return lbl
+    return Factory._ResultLabel(text="—")
 
 
 def _error_label() -> Label:
-    return Label(
-        text="",
-        size_hint=(1, None),
-        height=dp(26),
-        font_size=dp(13),
-        color=_C_RED,
-    )
+    return Factory._ErrorLabel(text="")
 
 
 def _convert_button(text: str = "Convert") -> Button:
-    return Button(
-        text=text,
-        size_hint=(1, None),
-        height=dp(52),
-        font_size=dp(17),
-        bold=True,
-        background_normal="",
-        background_color=_C_ACCENT,
-        color=_C_WHITE,
-    )
+    return Factory._ConvertButton(text=text)
 
 
 def _text_input(hint: str) -> TextInput:
-    return TextInput(
-        hint_text=hint,
-        size_hint=(1, None),
-        height=dp(52),
-        font_size=dp(19),
-        multiline=False,
-        padding=(dp(12), dp(14), dp(12), dp(14)),
-    )
+    return Factory._CalcInput(hint_text=hint)
 
 
 def _calc_section(*children, height_dp: int) -> BoxLayout:
@@ -268,6 +300,8 @@ class FractionTab(BoxLayout):
 
     def __init__(self, **kwargs):
         super().__init__(orientation="vertical", spacing=0, padding=0, **kwargs)
+        self._fmt_cache: dict[tuple[float, str], str] = {}
+        self._last_input: str | None = None
 
         self._entry = _text_input("e.g.  3/8  or  7/16")
         self._entry.bind(on_text_validate=lambda *_: self._convert())
@@ -298,22 +332,22 @@ class FractionTab(BoxLayout):
         ))
 
     def _on_row_select(self, row: tuple) -> None:
-        self._entry.text = row[0]
-        self._convert()
-
-    def _convert(self) -> None:
-        self._error.text = ""
-        try:
-            frac = Fraction(self._entry.text.strip())
-        except (ValueError, ZeroDivisionError):
-            self._error.text = "Enter a fraction like  3/8  or  7/16"
-            self._result.text = "—"
+        text, value = row[0]
+        self._entry.text = text
+        self._convert(value)
+
+    def _convert(self, value: float | None = None) -> None:
+        """Convert the entry text, or a known *value* from a reference row."""
+        # Results depend only on the entry text, so an unchanged entry is a no-op
+        if self._entry.text == self._last_input:
             return
-        if frac < 0:
-            self._error.text = "Value must be positive."
-            self._result.text = "—"
-            return
-        self._result.text = f"{float(frac):.6f}"
+        self._last_input = self._entry.text
+        if value is None:
+            ok, value, error = _parse_fraction(self._entry.text)
+        else:
+            ok, error = True, ""
+        self._error.text = error
+        self._result.text = _format_cached(self._fmt_cache, value, ".6f") if ok else "—"
 
 
 # ── Tab 2: Inches → Millimeters ───────────────────────────────────────────────
@@ -323,6 +357,8 @@ class InchesMMTab(BoxLayout):
 
     def __init__(self, **kwargs):
         super().__init__(orientation="vertical", spacing=0, padding=0, **kwargs)
+        self._fmt_cache: dict[tuple[float, str], str] = {}
+        self._last_input: str | None = None
 
         self._entry = _text_input("e.g.  3/8  or  1 3/8  or  0.375")
         self._entry.bind(on_text_validate=lambda *_: self._convert())
@@ -353,32 +389,24 @@ class InchesMMTab(BoxLayout):
         ))
 
     def _on_row_select(self, row: tuple) -> None:
-        # row = (fraction_str, decimal_str, mm_str) — populate with decimal inches
-        self._entry.text = row[1]
-        self._convert()
-
-    def _convert(self) -> None:
-        self._error.text = ""
-        raw = self._entry.text.strip()
-        try:
-            parts = raw.split()
-            if len(parts) == 2:
-                # Mixed number e.g. "1 3/8"
-                inches = float(int(parts[0]) + Fraction(parts[1]))
-            elif len(parts) == 1:
-                # Plain decimal or bare fraction e.g. "0.375" or "3/8"
-                inches = float(Fraction(raw))
-            else:
-                raise ValueError
-        except (ValueError, ZeroDivisionError):
-            self._error.text = "Enter a value like  3/8,  1 3/8,  or  0.375"
-            self._result.text = "—"
-            return
-        if inches < 0:
-            self._error.text = "Value must be positive."
-            self._result.text = "—"
+        # row = (fraction, decimal, mm) cells — populate with decimal inches
+        text, inches = row[1]
+        self._entry.text = text
+        self._convert(inches)
+
+    def _convert(self, inches: float | None = None) -> None:
+        """Convert the entry text, or a known *inches* value from a reference row."""
+        if self._entry.text == self._last_input:
             return
-        self._result.text = f"{inches * MM_PER_INCH:.4f}"
+        self._last_input = self._entry.text
+        if inches is None:
+            ok, inches, error = _parse_inches(self._entry.text)
+        else:
+            ok, error = True, ""
+        self._error.text = error
+        self._result.text = (
+            _format_cached(self._fmt_cache, inches * MM_PER_INCH, ".4f") if ok else "—"
+        )
 
 
 # ── Tab 3: Millimeters → Inches ───────────────────────────────────────────────
@@ -388,6 +416,8 @@ class MMInchesTab(BoxLayout):
 
     def __init__(self, **kwargs):
         super().__init__(orientation="vertical", spacing=0, padding=0, **kwargs)
+        self._fmt_cache: dict[tuple[float, str], str] = {}
+        self._last_input: str | None = None
 
         self._entry = _text_input("e.g.  25.4  or  9.525")
         self._entry.bind(on_text_validate=lambda *_: self._convert())
@@ -396,17 +426,9 @@ class MMInchesTab(BoxLayout):
         btn.bind(on_release=lambda *_: self._convert())
 
         self._result_in   = _result_label()
-        self._result_frac = Label(
-            text="—",
-            size_hint=(1, None),
-            height=dp(40),
-            font_size=dp(20),
-            bold=True,
-            color=_C_ACCENT,
-            halign="center",
-            valign="middle",
+        self._result_frac = Factory._ResultLabel(
+            text="—", height=dp(40), font_size=dp(20)
         )
-        self._result_frac.bind(size=self._result_frac.setter("text_size"))
         self._error = _error_label()
 
         calc = _calc_section(
@@ -431,37 +453,35 @@ class MMInchesTab(BoxLayout):
         ))
 
     def _on_row_select(self, row: tuple) -> None:
-        # row = (mm_str, decimal_str, fraction_str) — populate with mm value
-        self._entry.text = row[0]
-        self._convert()
-
-    def _convert(self) -> None:
-        self._error.text = ""
-        try:
-            mm = float(self._entry.text.strip())
-        except ValueError:
-            self._error.text = "Enter a numeric millimeter value."
-            self._result_in.text = "—"
-            self._result_frac.text = "—"
+        # row = (mm, decimal, fraction) cells — populate with mm value
+        text, mm = row[0]
+        self._entry.text = text
+        self._convert(mm)
+
+    def _convert(self, mm: float | None = None) -> None:
+        """Convert the entry text, or a known *mm* value from a reference row."""
+        if self._entry.text == self._last_input:
             return
-        if mm < 0:
-            self._error.text = "Value must be positive."
+        self._last_input = self._entry.text
+        if mm is None:
+            ok, mm, error = _parse_mm(self._entry.text)
+        else:
+            ok, error = True, ""
+        self._error.text = error
+        if not ok:
             self._result_in.text = "—"
             self._result_frac.text = "—"
             return
 
         inches = mm / MM_PER_INCH
-        self._result_in.text = f"{inches:.6f}"
-
-        nearest = Fraction(inches).limit_denominator(64)
-        whole = int(nearest)
-        remainder = nearest - whole
-        if whole == 0:
-            frac_str = str(remainder)
-        elif remainder == 0:
+        self._result_in.text = _format_cached(self._fmt_cache, inches, ".6f")
+
+        # Snap straight to the nearest 64th — no continued-fraction search needed
+        whole, sixtyfourths = divmod(round(mm * 64 / MM_PER_INCH), 64)
+        if sixtyfourths == 0:
             frac_str = str(whole)
         else:
-            frac_str = f"{whole} {remainder}"
+            frac_str = f"{whole} {_SNAP64[sixtyfourths]}" if whole else _SNAP64[sixtyfourths]
         self._result_frac.text = frac_str
 
 
@@ -479,17 +499,27 @@ class DecimalConverterApp(App):
             tab_height=dp(48),
         )
 
+        # Tab bodies are built on first selection; until then each tab holds an
+        # empty placeholder that the real content is added into.
+        self._unbuilt_tabs: dict[TabbedPanelItem, type] = {}
         for label, content_cls in [
             ("Frac → Dec", FractionTab),
             ("In → mm",   InchesMMTab),
             ("mm → In",   MMInchesTab),
         ]:
             item = TabbedPanelItem(text=label, font_size=dp(14))
-            item.add_widget(content_cls())
+            item.add_widget(BoxLayout())
+            self._unbuilt_tabs[item] = content_cls
             panel.add_widget(item)
 
+        panel.bind(current_tab=self._ensure_built)
         return panel
 
+    def _ensure_built(self, panel: TabbedPanel, item: TabbedPanelItem) -> None:
+        content_cls = self._unbuilt_tabs.pop(item, None)
+        if content_cls is not None:
+            item.content.add_widget(content_cls())
+
 
 if __name__ == "__main__":
     DecimalConverterApp().run()
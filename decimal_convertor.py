@@ -14,18 +14,25 @@ Settings are persisted in %APPDATA%\\DecimalConverter\\settings.json.
 
 from __future__ import annotations
 
+import functools
 import json
+import math
 import os
+import queue
+import re
 import sys
 import threading
 import tkinter as tk
-from fractions import Fraction
 from pathlib import Path
 from tkinter import ttk
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
-import pystray
-from PIL import Image, ImageDraw, ImageTk
+from PIL import Image, ImageTk
+
+# pystray and PIL.ImageDraw are only needed once the app is sent to the tray,
+# so they are imported lazily there to keep startup light.
+if TYPE_CHECKING:
+    import pystray
 
 
 # ── Resource utilities ────────────────────────────────────────────────────────
@@ -40,6 +47,13 @@ def _resource_path(filename: str) -> Path:
     return base / filename
 
 
+@functools.cache
+def _settings_file() -> Path:
+    """Return the settings path, resolved on first use rather than at import."""
+    base = os.environ.get("APPDATA") or os.path.expanduser("~")
+    return Path(base) / "DecimalConverter" / "settings.json"
+
+
 # ── Version ───────────────────────────────────────────────────────────────────
 
 try:
@@ -52,27 +66,74 @@ except OSError:
 
 MM_PER_INCH: float = 25.4  # exact, defined by international agreement
 
-SETTINGS_FILE: Path = (
-    Path(os.environ.get("APPDATA", Path.home())) / "DecimalConverter" / "settings.json"
+# All unique reduced fractions with denominators 2, 4, 8, 16, 32, 64 as
+# (numerator, denominator) pairs, sorted by value (compared exactly in 64ths)
+COMMON_FRACTIONS: list[tuple[int, int]] = sorted(
+    ((n, d) for d in (2, 4, 8, 16, 32, 64) for n in range(1, d) if math.gcd(n, d) == 1),
+    key=lambda nd: nd[0] * (64 // nd[1]),
 )
 
-# All unique reduced fractions with denominators 2, 4, 8, 16, 32, 64 — sorted
-COMMON_FRACTIONS: list[Fraction] = sorted(set(
-    Fraction(n, d)
-    for d in [2, 4, 8, 16, 32, 64]
-    for n in range(1, d)
-    if Fraction(n, d).denominator == d
-))
+# Reference table rows, formatted once at import and shared by every tab:
+# (fraction, decimal inches, millimeters)
+_ROWS: tuple[tuple[str, str, str], ...] = tuple(
+    (f"{n}/{d}", f"{n / d:.6f}", f"{n / d * MM_PER_INCH:.4f}")
+    for n, d in COMMON_FRACTIONS
+)
+
+# Reduced fraction text for each remainder in 64ths, indexed by numerator
+# (index 0 is unused: a whole number has no fractional part)
+_SNAP64: tuple[str, ...] = ("",) + tuple(
+    f"{n // math.gcd(n, 64)}/{64 // math.gcd(n, 64)}" for n in range(1, 64)
+)
+
+# Input grammars, matched with fullmatch so no anchors are needed
+_FRAC_RE = re.compile(r"([-+]?)(?:(\d+)\s+)?(\d+)/(\d+)")   # "3/8" or "1 3/8"
+_DEC_RE = re.compile(r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)")      # "0.375" or ".375"
 
 _ACCENT_COLOR = "#1a5fb4"
 _RESULT_FONT = ("Courier", 14, "bold")
 _TAB_PAD: dict[str, int] = {"padx": 10, "pady": 6}
 
 
+# ── Parsing ───────────────────────────────────────────────────────────────────
+
+def _parse_inches(raw: str, allow_mixed: bool = True) -> float:
+    """Parse a fraction (``3/8``), mixed number (``1 3/8``) or decimal (``0.375``).
+
+    Input is checked against the precompiled grammars before any numeric work;
+    fractions use integer arithmetic and decimals ``float()``.
+    Raises ValueError on bad input, ZeroDivisionError for a zero denominator and
+    OverflowError for a fraction too large for a float.
+    """
+    match = _FRAC_RE.fullmatch(raw)
+    if match:
+        sign, whole, num, den = match.groups()
+        if whole is not None and not allow_mixed:
+            raise ValueError(raw)
+        value = (int(whole or 0) * int(den) + int(num)) / int(den)
+        if sign == "-":
+            value = -value
+    elif _DEC_RE.fullmatch(raw):
+        # A long enough digit string is grammatical but overflows float() to inf
+        value = float(raw)
+        if not math.isfinite(value):
+            raise ValueError(raw)
+    else:
+        raise ValueError(raw)
+    return value + 0.0  # "-0" parses to -0.0; show it as 0
+
+
 # ── Tray icon ─────────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
 def _make_tray_image() -> Image.Image:
-    """Draw a small ruler icon for the system tray (64 × 64 px)."""
+    """Draw a small ruler icon for the system tray (64 × 64 px).
+
+    The image is drawn once and reused for every minimise; callers must not
+    modify it.
+    """
+    from PIL import ImageDraw
+
     size = 64
     img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
@@ -83,6 +144,47 @@ def _make_tray_image() -> Image.Image:
     return img
 
 
+# ── Reference tables ──────────────────────────────────────────────────────────
+
+def _insert_rows(tree: ttk.Treeview, rows: Iterable[tuple[str, ...]]) -> None:
+    """Append *rows* to *tree* with direct Tcl calls.
+
+    Bypasses ttk.Treeview.insert's per-call option handling. The tree's requested
+    size depends only on its height and column widths, so rows can be added
+    after it is laid out without resizing the window.
+    """
+    tk_call, path = tree.tk.call, tree._w
+    for values in rows:
+        tk_call(path, "insert", "", "end", "-values", values)
+
+
+def _make_ref_tree(
+    parent: ttk.LabelFrame,
+    col_specs: Iterable[tuple[str, str, int]],
+) -> ttk.Treeview:
+    """Build an empty, scrollable reference Treeview inside *parent*.
+
+    *col_specs* lists ``(name, heading, width)`` for each column, in order.
+    """
+    col_specs = tuple(col_specs)
+    tree = ttk.Treeview(
+        parent,
+        columns=tuple(name for name, _heading, _width in col_specs),
+        show="headings",
+        height=20,
+        selectmode="browse",
+    )
+    for name, heading, width in col_specs:
+        tree.heading(name, text=heading)
+        tree.column(name, width=width, anchor="center")
+
+    scrollbar = ttk.Scrollbar(parent, orient="vertical", command=tree.yview)
+    tree.configure(yscrollcommand=scrollbar.set)
+    tree.grid(row=0, column=0, sticky="nsew")
+    scrollbar.grid(row=0, column=1, sticky="ns")
+    return tree
+
+
 # ── Application ───────────────────────────────────────────────────────────────
 
 class DecimalConverterApp(tk.Tk):
@@ -93,15 +195,25 @@ class DecimalConverterApp(tk.Tk):
         self.title(f"Decimal Equivalent Calculator v{APP_VERSION}")
         self.resizable(False, False)
         self._tray_icon: pystray.Icon | None = None
+        self._about_photo: ImageTk.PhotoImage | None = None
 
+        self._settings_cache = self._read_settings_file()
+        self._settings_queue: queue.Queue[dict[str, Any]] | None = None
         self.minimize_to_tray = tk.BooleanVar(value=self._load_setting("minimize_to_tray", True))
         self.minimal_ui = tk.BooleanVar(value=self._load_setting("minimal_ui", False))
         self._ref_frames: list[ttk.LabelFrame] = []
+        self._pending_ref_tables: list[
+            tuple[ttk.Frame, Callable[[ttk.Frame], ttk.LabelFrame]]
+        ] = []
+        # Reference rows waiting for their tab to be shown, keyed by tab path
+        self._pending_rows: dict[str, tuple[ttk.Treeview, Iterable[tuple[str, ...]]]] = {}
+        self._minimal_state: bool | None = None  # last state applied to the UI
 
         self._load_app_icon()
+        self._configure_styles()
         self._build_menu()
         self._build_ui()
-        self._apply_minimal_ui()
+        self._apply_minimal_ui(resize=False)
 
         self.bind("<Unmap>", self._on_unmap)
         self.protocol("WM_DELETE_WINDOW", self._quit_app)
@@ -116,26 +228,67 @@ class DecimalConverterApp(tk.Tk):
         except OSError:
             pass
 
+    # ── Styles ────────────────────────────────────────────────────────────────
+
+    def _configure_styles(self) -> None:
+        """Define the named label styles shared by all tabs."""
+        style = ttk.Style(self)
+        style.configure("Result.TLabel", font=_RESULT_FONT, foreground=_ACCENT_COLOR)
+        style.configure("Error.TLabel", foreground="red")
+        style.configure("Hint.TLabel", foreground="gray")
+
     # ── Settings persistence ──────────────────────────────────────────────────
 
-    def _load_setting(self, key: str, default: Any) -> Any:
+    @staticmethod
+    def _read_settings_file() -> dict[str, Any]:
         try:
-            data = json.loads(SETTINGS_FILE.read_text())
-            return data.get(key, default)
+            data = json.loads(_settings_file().read_text())
         except (FileNotFoundError, json.JSONDecodeError, OSError):
-            return default
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _load_setting(self, key: str, default: Any) -> Any:
+        return self._settings_cache.get(key, default)
 
     def _save_settings(self) -> None:
-        try:
-            SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
-            SETTINGS_FILE.write_text(
-                json.dumps({
-                    "minimize_to_tray": self.minimize_to_tray.get(),
-                    "minimal_ui": self.minimal_ui.get(),
-                }, indent=2)
-            )
-        except OSError:
-            pass
+        settings = {
+            "minimize_to_tray": self.minimize_to_tray.get(),
+            "minimal_ui": self.minimal_ui.get(),
+        }
+        # The cache mirrors what has been queued for disk, so an unchanged
+        # toggle needs no write
+        if settings == self._settings_cache:
+            return
+        # The write happens on a background thread so a slow disk never stalls
+        # the UI; the thread is started on the first save
+        if self._settings_queue is None:
+            self._settings_queue = queue.Queue()
+            threading.Thread(
+                target=self._write_settings_worker, args=(self._settings_queue,), daemon=True
+            ).start()
+        self._settings_queue.put(settings)
+        self._settings_cache = settings
+
+    @staticmethod
+    def _write_settings_worker(pending: queue.Queue[dict[str, Any]]) -> None:
+        """Write each queued settings dict to disk, in order. Runs forever."""
+        dir_ready = False
+        while True:
+            settings = pending.get()
+            try:
+                settings_file = _settings_file()
+                if not dir_ready:
+                    settings_file.parent.mkdir(parents=True, exist_ok=True)
+                    dir_ready = True
+                # Write a sibling temp file and swap it in, so an interrupted
+                # write never leaves a truncated settings.json behind
+                tmp_file = settings_file.with_suffix(".tmp")
+                tmp_file.write_text(json.dumps(settings))
+                os.replace(tmp_file, settings_file)
+            except OSError:
+                pass
+            finally:
+                pending.task_done()
 
     # ── Menu bar ──────────────────────────────────────────────────────────────
 
@@ -168,34 +321,45 @@ class DecimalConverterApp(tk.Tk):
         top.grab_set()
 
         try:
-            img = Image.open(_resource_path("DecimalConverter.png"))
-            photo = ImageTk.PhotoImage(img.resize((80, 80), Image.LANCZOS))
-            lbl = ttk.Label(top, image=photo)
-            lbl.image = photo  # keep reference alive
-            lbl.pack(pady=(16, 8))
+            # Resampled once, then reused each time the dialog is opened
+            if self._about_photo is None:
+                img = Image.open(_resource_path("DecimalConverter.png"))
+                self._about_photo = ImageTk.PhotoImage(img.resize((80, 80), Image.LANCZOS))
+            ttk.Label(top, image=self._about_photo).pack(pady=(16, 8))
         except OSError:
             pass
 
         ttk.Label(top, text="Decimal Equivalent Calculator", font=("", 11, "bold")).pack()
         ttk.Label(top, text=f"Version {APP_VERSION}").pack(pady=4)
-        ttk.Label(top, text="Simple tool by CodingAttempts", foreground="gray").pack()
+        ttk.Label(top, text="Simple tool by CodingAttempts", style="Hint.TLabel").pack()
         ttk.Button(top, text="OK", command=top.destroy).pack(pady=(12, 16))
 
         top.wait_window()
 
     def _on_minimal_ui_toggle(self) -> None:
+        if not self.minimal_ui.get():
+            self._ensure_ref_tables()
         self._apply_minimal_ui()
         self._save_settings()
 
-    def _apply_minimal_ui(self) -> None:
-        if self.minimal_ui.get():
+    def _apply_minimal_ui(self, resize: bool = True) -> None:
+        minimal = self.minimal_ui.get()
+        if minimal == self._minimal_state:
+            return
+        self._minimal_state = minimal
+
+        if minimal:
             for frame in self._ref_frames:
                 frame.grid_remove()
         else:
             for frame in self._ref_frames:
                 frame.grid()
-        self.update_idletasks()
-        self.geometry("")
+
+        # During __init__ (resize=False) the window has not been laid out yet and
+        # mainloop will size it, so the idle flush and geometry reset are skipped.
+        if resize:
+            self.update_idletasks()
+            self.geometry("")
 
     # ── System tray ───────────────────────────────────────────────────────────
 
@@ -205,8 +369,13 @@ class DecimalConverterApp(tk.Tk):
             self._start_tray()
 
     def _start_tray(self) -> None:
+        # The icon is created and its loop started once; later minimise/restore
+        # cycles only toggle visibility instead of rebuilding the icon.
         if self._tray_icon is not None:
+            self._tray_icon.visible = True
             return
+        import pystray
+
         menu = pystray.Menu(
             pystray.MenuItem("Restore", self._restore, default=True),
             pystray.MenuItem("Quit", self._quit_app),
@@ -218,11 +387,12 @@ class DecimalConverterApp(tk.Tk):
 
     def _restore(self, icon: pystray.Icon | None = None, item: Any = None) -> None:
         if self._tray_icon:
-            self._tray_icon.stop()
-            self._tray_icon = None
+            self._tray_icon.visible = False
         self.after(0, self.deiconify)
 
     def _quit_app(self, icon: pystray.Icon | None = None, item: Any = None) -> None:
+        if self._settings_queue is not None:
+            self._settings_queue.join()  # let any queued settings reach disk
         if self._tray_icon:
             self._tray_icon.stop()
             self._tray_icon = None
@@ -233,7 +403,10 @@ class DecimalConverterApp(tk.Tk):
     def _build_ui(self) -> None:
         notebook = ttk.Notebook(self)
         notebook.grid(row=0, column=0, padx=10, pady=10)
+        self._notebook = notebook
 
+        # Every tab's widgets are built up front so the notebook opens at its
+        # final size; only the reference rows wait until a tab is first shown.
         tab1 = ttk.Frame(notebook, padding=4)
         notebook.add(tab1, text="Fraction → Decimal")
         self._build_fraction_tab(tab1)
@@ -246,6 +419,37 @@ class DecimalConverterApp(tk.Tk):
         notebook.add(tab3, text="Millimeters → Inches")
         self._build_mm_inches_tab(tab3)
 
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, event: tk.Event) -> None:
+        pending = self._pending_rows.pop(event.widget.select(), None)
+        if pending is not None:
+            _insert_rows(*pending)
+
+    def _fill_ref_tree(
+        self, tab: ttk.Frame, tree: ttk.Treeview, rows: Iterable[tuple[str, ...]]
+    ) -> None:
+        """Insert *rows* now if *tab* is showing, otherwise on its first selection."""
+        if self._notebook.select() == str(tab):
+            _insert_rows(tree, rows)
+        else:
+            self._pending_rows[str(tab)] = (tree, rows)
+
+    def _add_ref_table(
+        self, parent: ttk.Frame, build_ref: Callable[[ttk.Frame], ttk.LabelFrame]
+    ) -> None:
+        """Build a tab's reference table, or defer it while Minimal UI hides it."""
+        if self.minimal_ui.get():
+            self._pending_ref_tables.append((parent, build_ref))
+        else:
+            self._ref_frames.append(build_ref(parent))
+
+    def _ensure_ref_tables(self) -> None:
+        """Build any reference tables deferred by _add_ref_table."""
+        for parent, build_ref in self._pending_ref_tables:
+            self._ref_frames.append(build_ref(parent))
+        self._pending_ref_tables.clear()
+
     # ── Tab 1: Fraction → Decimal ─────────────────────────────────────────────
 
     def _build_fraction_tab(self, parent: ttk.Frame) -> None:
@@ -259,7 +463,7 @@ class DecimalConverterApp(tk.Tk):
         frac_entry = ttk.Entry(calc_frame, textvariable=self.fraction_var, width=10)
         frac_entry.grid(row=0, column=1, sticky="w", padx=(0, 4), pady=4)
         frac_entry.bind("<Return>", self._convert_fraction)
-        ttk.Label(calc_frame, text="e.g.  3/8  or  7/16", foreground="gray").grid(
+        ttk.Label(calc_frame, text="e.g.  3/8  or  7/16", style="Hint.TLabel").grid(
             row=0, column=2, sticky="w", padx=(2, 8)
         )
 
@@ -274,62 +478,59 @@ class DecimalConverterApp(tk.Tk):
         ttk.Label(
             calc_frame,
             textvariable=self.frac_result_var,
-            font=_RESULT_FONT,
-            foreground=_ACCENT_COLOR,
+            style="Result.TLabel",
             width=12,
         ).grid(row=2, column=1, sticky="w", padx=(0, 8), pady=4)
 
         self.frac_error_var = tk.StringVar()
         ttk.Label(
-            calc_frame, textvariable=self.frac_error_var, foreground="red"
+            calc_frame, textvariable=self.frac_error_var, style="Error.TLabel"
         ).grid(row=3, column=0, columnspan=2, pady=(0, 6))
 
+        self._add_ref_table(parent, self._build_fraction_ref)
+        frac_entry.focus_set()
+
+    def _build_fraction_ref(self, parent: ttk.Frame) -> ttk.LabelFrame:
         ref_frame = ttk.LabelFrame(parent, text="Common Fractions Reference")
         ref_frame.grid(row=1, column=0, sticky="nsew", **_TAB_PAD)
-        self._ref_frames.append(ref_frame)
 
-        columns = ("fraction", "decimal")
-        tree = ttk.Treeview(
-            ref_frame, columns=columns, show="headings", height=20, selectmode="browse"
+        tree = _make_ref_tree(
+            ref_frame,
+            (("fraction", "Fraction (in)", 140), ("decimal", "Decimal (in)", 140)),
         )
-        tree.heading("fraction", text="Fraction (in)")
-        tree.heading("decimal", text="Decimal (in)")
-        tree.column("fraction", width=140, anchor="center")
-        tree.column("decimal", width=140, anchor="center")
-
-        scrollbar = ttk.Scrollbar(ref_frame, orient="vertical", command=tree.yview)
-        tree.configure(yscrollcommand=scrollbar.set)
-        tree.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
+        self._fill_ref_tree(parent, tree, ((frac_s, dec_s) for frac_s, dec_s, _mm_s in _ROWS))
 
-        for frac in COMMON_FRACTIONS:
-            tree.insert("", "end", values=(str(frac), f"{float(frac):.6f}"))
-
-        tree.bind("<<TreeviewSelect>>", lambda e: self._on_frac_row_select(tree))
-        frac_entry.focus_set()
+        on_select = self._on_frac_row_select
+        tree.bind("<<TreeviewSelect>>", lambda e, t=tree, cb=on_select: cb(t))
+        return ref_frame
 
     def _on_frac_row_select(self, tree: ttk.Treeview) -> None:
         selection = tree.selection()
         if not selection:
             return
-        self.fraction_var.set(tree.item(selection[0], "values")[0])
-        self._convert_fraction()
+        # The row already holds the converted value; show it without re-parsing
+        frac_s, dec_s = tree.item(selection[0], "values")
+        self.fraction_var.set(frac_s)
+        self.frac_result_var.set(dec_s)
+        self.frac_error_var.set("")
 
     def _convert_fraction(self, _event: tk.Event | None = None) -> None:
-        self.frac_error_var.set("")
+        set_err, set_res = self.frac_error_var.set, self.frac_result_var.set
+        set_err("")
+        raw = self.fraction_var.get().strip()
         try:
-            frac = Fraction(self.fraction_var.get().strip())
-        except (ValueError, ZeroDivisionError):
-            self.frac_error_var.set("Enter a fraction like  3/8  or  7/16")
-            self.frac_result_var.set("—")
+            value = _parse_inches(raw, allow_mixed=False)
+        except (ValueError, ZeroDivisionError, OverflowError):
+            set_err("Enter a fraction like  3/8  or  7/16")
+            set_res("—")
             return
 
-        if frac < 0:
-            self.frac_error_var.set("Value must be positive.")
-            self.frac_result_var.set("—")
+        if value < 0:
+            set_err("Value must be positive.")
+            set_res("—")
             return
 
-        self.frac_result_var.set(f"{float(frac):.6f}")
+        set_res(f"{value:.6f}")
 
     # ── Tab 2: Inches → Millimeters ───────────────────────────────────────────
 
@@ -344,7 +545,7 @@ class DecimalConverterApp(tk.Tk):
         inches_entry = ttk.Entry(calc_frame, textvariable=self.inches_var, width=12)
         inches_entry.grid(row=0, column=1, sticky="w", padx=(0, 4), pady=4)
         inches_entry.bind("<Return>", self._convert_inches)
-        ttk.Label(calc_frame, text="e.g.  3/8  or  1 3/8  or  0.375", foreground="gray").grid(
+        ttk.Label(calc_frame, text="e.g.  3/8  or  1 3/8  or  0.375", style="Hint.TLabel").grid(
             row=0, column=2, sticky="w", padx=(2, 8)
         )
 
@@ -356,81 +557,68 @@ class DecimalConverterApp(tk.Tk):
             row=2, column=0, sticky="e", padx=(8, 4), pady=4
         )
         self.mm_result_var = tk.StringVar(value="—")
+        self._mm_result_name = str(self.mm_result_var)  # Tcl name for fast updates
         ttk.Label(
             calc_frame,
             textvariable=self.mm_result_var,
-            font=_RESULT_FONT,
-            foreground=_ACCENT_COLOR,
+            style="Result.TLabel",
             width=14,
         ).grid(row=2, column=1, sticky="w", padx=(0, 8), pady=4)
 
         self.inches_error_var = tk.StringVar()
         ttk.Label(
-            calc_frame, textvariable=self.inches_error_var, foreground="red"
+            calc_frame, textvariable=self.inches_error_var, style="Error.TLabel"
         ).grid(row=3, column=0, columnspan=2, pady=(0, 6))
 
+        self._add_ref_table(parent, self._build_inches_mm_ref)
+        inches_entry.focus_set()
+
+    def _build_inches_mm_ref(self, parent: ttk.Frame) -> ttk.LabelFrame:
         ref_frame = ttk.LabelFrame(parent, text="Common Conversions Reference")
         ref_frame.grid(row=1, column=0, sticky="nsew", **_TAB_PAD)
-        self._ref_frames.append(ref_frame)
 
-        columns = ("fraction", "inches", "mm")
-        tree = ttk.Treeview(
-            ref_frame, columns=columns, show="headings", height=20, selectmode="browse"
+        tree = _make_ref_tree(
+            ref_frame,
+            (
+                ("fraction", "Fraction (in)", 110),
+                ("inches", "Decimal (in)", 110),
+                ("mm", "Millimeters", 110),
+            ),
         )
-        tree.heading("fraction", text="Fraction (in)")
-        tree.heading("inches", text="Decimal (in)")
-        tree.heading("mm", text="Millimeters")
-        tree.column("fraction", width=110, anchor="center")
-        tree.column("inches", width=110, anchor="center")
-        tree.column("mm", width=110, anchor="center")
-
-        scrollbar = ttk.Scrollbar(ref_frame, orient="vertical", command=tree.yview)
-        tree.configure(yscrollcommand=scrollbar.set)
-        tree.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
-
-        for frac in COMMON_FRACTIONS:
-            inch_val = float(frac)
-            tree.insert(
-                "", "end",
-                values=(str(frac), f"{inch_val:.6f}", f"{inch_val * MM_PER_INCH:.4f}")
-            )
-
-        tree.bind("<<TreeviewSelect>>", lambda e: self._on_inches_row_select(tree))
-        inches_entry.focus_set()
+        self._fill_ref_tree(parent, tree, _ROWS)
+
+        on_select = self._on_inches_row_select
+        tree.bind("<<TreeviewSelect>>", lambda e, t=tree, cb=on_select: cb(t))
+        return ref_frame
 
     def _on_inches_row_select(self, tree: ttk.Treeview) -> None:
         selection = tree.selection()
         if not selection:
             return
-        self.inches_var.set(tree.item(selection[0], "values")[1])
-        self._convert_inches()
+        _frac_s, dec_s, mm_s = tree.item(selection[0], "values")
+        self.inches_var.set(dec_s)
+        self.mm_result_var.set(mm_s)
+        self.inches_error_var.set("")
 
     def _convert_inches(self, _event: tk.Event | None = None) -> None:
-        self.inches_error_var.set("")
+        set_err, set_res = self.inches_error_var.set, self.mm_result_var.set
+        set_err("")
         raw = self.inches_var.get().strip()
 
         try:
-            parts = raw.split()
-            if len(parts) == 2:
-                # Mixed number e.g. "1 3/8"
-                inches = float(int(parts[0]) + Fraction(parts[1]))
-            elif len(parts) == 1:
-                # Plain decimal or fraction e.g. "0.375" or "3/8"
-                inches = float(Fraction(raw))
-            else:
-                raise ValueError
-        except (ValueError, ZeroDivisionError):
-            self.inches_error_var.set("Enter a value like  3/8,  1 3/8,  or  0.375")
-            self.mm_result_var.set("—")
+            inches = _parse_inches(raw)
+        except (ValueError, ZeroDivisionError, OverflowError):
+            set_err("Enter a value like  3/8,  1 3/8,  or  0.375")
+            set_res("—")
             return
 
         if inches < 0:
-            self.inches_error_var.set("Value must be positive.")
-            self.mm_result_var.set("—")
+            set_err("Value must be positive.")
+            set_res("—")
             return
 
-        self.mm_result_var.set(f"{inches * MM_PER_INCH:.4f}")
+        # Set the Tcl variable directly, skipping the StringVar.set wrapper
+        self.tk.globalsetvar(self._mm_result_name, f"{inches * MM_PER_INCH:.4f}")
 
     # ── Tab 3: Millimeters → Inches ───────────────────────────────────────────
 
@@ -445,7 +633,7 @@ class DecimalConverterApp(tk.Tk):
         mm_entry = ttk.Entry(calc_frame, textvariable=self.mm_input_var, width=12)
         mm_entry.grid(row=0, column=1, sticky="w", padx=(0, 4), pady=4)
         mm_entry.bind("<Return>", self._convert_mm)
-        ttk.Label(calc_frame, text="e.g.  25.4  or  9.525", foreground="gray").grid(
+        ttk.Label(calc_frame, text="e.g.  25.4  or  9.525", style="Hint.TLabel").grid(
             row=0, column=2, sticky="w", padx=(2, 8)
         )
 
@@ -460,8 +648,7 @@ class DecimalConverterApp(tk.Tk):
         ttk.Label(
             calc_frame,
             textvariable=self.mm_to_in_result_var,
-            font=_RESULT_FONT,
-            foreground=_ACCENT_COLOR,
+            style="Result.TLabel",
             width=14,
         ).grid(row=2, column=1, sticky="w", padx=(0, 8), pady=4)
 
@@ -472,81 +659,79 @@ class DecimalConverterApp(tk.Tk):
         ttk.Label(
             calc_frame,
             textvariable=self.mm_to_in_frac_var,
-            font=_RESULT_FONT,
-            foreground=_ACCENT_COLOR,
+            style="Result.TLabel",
             width=14,
         ).grid(row=3, column=1, sticky="w", padx=(0, 8), pady=4)
 
         self.mm_error_var = tk.StringVar()
         ttk.Label(
-            calc_frame, textvariable=self.mm_error_var, foreground="red"
+            calc_frame, textvariable=self.mm_error_var, style="Error.TLabel"
         ).grid(row=4, column=0, columnspan=2, pady=(0, 6))
 
+        self._add_ref_table(parent, self._build_mm_inches_ref)
+        mm_entry.focus_set()
+
+    def _build_mm_inches_ref(self, parent: ttk.Frame) -> ttk.LabelFrame:
         ref_frame = ttk.LabelFrame(parent, text="Common Conversions Reference")
         ref_frame.grid(row=1, column=0, sticky="nsew", **_TAB_PAD)
-        self._ref_frames.append(ref_frame)
 
-        columns = ("mm", "inches", "fraction")
-        tree = ttk.Treeview(
-            ref_frame, columns=columns, show="headings", height=20, selectmode="browse"
+        tree = _make_ref_tree(
+            ref_frame,
+            (
+                ("mm", "Millimeters", 110),
+                ("inches", "Decimal (in)", 110),
+                ("fraction", "Fraction (in)", 110),
+            ),
         )
-        tree.heading("mm", text="Millimeters")
-        tree.heading("inches", text="Decimal (in)")
-        tree.heading("fraction", text="Fraction (in)")
-        tree.column("mm", width=110, anchor="center")
-        tree.column("inches", width=110, anchor="center")
-        tree.column("fraction", width=110, anchor="center")
-
-        scrollbar = ttk.Scrollbar(ref_frame, orient="vertical", command=tree.yview)
-        tree.configure(yscrollcommand=scrollbar.set)
-        tree.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
-
-        for frac in COMMON_FRACTIONS:
-            inch_val = float(frac)
-            tree.insert(
-                "", "end",
-                values=(f"{inch_val * MM_PER_INCH:.4f}", f"{inch_val:.6f}", str(frac))
-            )
-
-        tree.bind("<<TreeviewSelect>>", lambda e: self._on_mm_row_select(tree))
-        mm_entry.focus_set()
+        self._fill_ref_tree(parent, tree, ((mm_s, dec_s, frac_s) for frac_s, dec_s, mm_s in _ROWS))
+
+        on_select = self._on_mm_row_select
+        tree.bind("<<TreeviewSelect>>", lambda e, t=tree, cb=on_select: cb(t))
+        return ref_frame
 
     def _on_mm_row_select(self, tree: ttk.Treeview) -> None:
         selection = tree.selection()
         if not selection:
             return
-        self.mm_input_var.set(tree.item(selection[0], "values")[0])
+        # The mm cell is rounded to 4 places, so convert that displayed value
+        # rather than show the row's exact inches: clicking a row then matches
+        # typing it (and the Android app's behaviour)
+        mm_s, _dec_s, _frac_s = tree.item(selection[0], "values")
+        self.mm_input_var.set(mm_s)
         self._convert_mm()
 
     def _convert_mm(self, _event: tk.Event | None = None) -> None:
-        self.mm_error_var.set("")
+        set_err = self.mm_error_var.set
+        set_res = self.mm_to_in_result_var.set
+        set_frac = self.mm_to_in_frac_var.set
+        set_err("")
         try:
-            mm = float(self.mm_input_var.get().strip())
+            mm = float(self.mm_input_var.get().strip()) + 0.0  # -0.0 -> 0.0
+            if not math.isfinite(mm):  # inf/nan would break the 64ths snap
+                raise ValueError(mm)
         except ValueError:
-            self.mm_error_var.set("Enter a numeric value in millimeters.")
-            self.mm_to_in_result_var.set("—")
-            self.mm_to_in_frac_var.set("—")
+            set_err("Enter a numeric value in millimeters.")
+            set_res("—")
+            set_frac("—")
             return
 
         if mm < 0:
-            self.mm_error_var.set("Value must be positive.")
-            self.mm_to_in_result_var.set("—")
-            self.mm_to_in_frac_var.set("—")
+            set_err("Value must be positive.")
+            set_res("—")
+            set_frac("—")
             return
 
         inches = mm / MM_PER_INCH
-        self.mm_to_in_result_var.set(f"{inches:.6f}")
-        nearest = Fraction(inches).limit_denominator(64)
-        whole = int(nearest)
-        remainder = nearest - whole
-        if whole == 0:
-            frac_str = str(remainder)
-        elif remainder == 0:
+        set_res(f"{inches:.6f}")
+        # Nearest 64th; the reduced fraction text comes from the lookup table
+        whole, rem = divmod(round(inches * 64), 64)
+        if rem == 0:
             frac_str = str(whole)
+        elif whole == 0:
+            frac_str = _SNAP64[rem]
         else:
-            frac_str = f"{whole} {remainder}"
-        self.mm_to_in_frac_var.set(frac_str)
+            frac_str = f"{whole} {_SNAP64[rem]}"
+        set_frac(frac_str)
 
 
 # ── Entry point ───────────────────────────────────────────────────────────────